@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+
+"""
+Benchmarks for the word list pipeline and the hot paths of cli-wordle.
+
+All word lists are generated locally, so the benchmarks run offline:
+
+    ./benchmarks/bench_wordle.py run -o results.json
+    ./benchmarks/bench_wordle.py compare baseline.json results.json
+
+compare exits with status 1 if any benchmark got slower than the
+baseline by more than the threshold (default: 25 %), or is missing
+from the new results.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import random
+import platform
+import tempfile
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+
+# import the game from the parent directory:
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+import cli_wordle
+
+SIZES = [10_000, 100_000, 1_000_000]
+WORD_LEN = 5
+
+# letters by rough frequency, the last ones are rare enough
+# to be filtered out by generate_word_list():
+LETTERS = "ETAOINSHRDLUCMFWYPVBGK"
+RARE_LETTERS = "JQXZ"
+
+
+def synthetic_word(rng: random.Random, length: int) -> str:
+    """
+    Make up a random word.
+
+    :param rng: the random number generator to use
+    :param length: number of letters in the word
+    :return: a lowercase word, with a rare letter every now and then
+    """
+    ltrs = rng.choices(LETTERS, weights=range(len(LETTERS), 0, -1), k=length)
+    if rng.random() < 0.002:
+        ltrs[rng.randrange(length)] = rng.choice(RARE_LETTERS)
+    return "".join(ltrs).lower()
+
+
+def synthetic_source(size: int, seed: int = 1) -> list:
+    """
+    Make a source word list like the downloaded ones.
+
+    :param size: number of entries in the list
+    :param seed: seed for the random number generator
+    :return: a sorted list of words of mixed length, some of them
+    with spaces, and with duplicates
+    """
+    rng = random.Random(seed)
+    words: list = []
+    for _ in range(size):
+        word = synthetic_word(rng, rng.randint(2, 12))
+        if rng.random() < 0.01:
+            word = f"{word} {synthetic_word(rng, 3)}"
+        words.append(word)
+    words.sort()
+    return words
+
+
+def synthetic_game_words(size: int, seed: int = 2) -> list:
+    """
+    Make a list of distinct game words like generate_word_list() writes.
+
+    :param size: number of words in the list
+    :param seed: seed for the random number generator
+    :return: a list of uppercase WORD_LEN letter words
+    """
+    rng = random.Random(seed)
+    words: dict = {}
+    while len(words) < size:
+        words[synthetic_word(rng, WORD_LEN).upper()] = None
+    return list(words)
+
+
+def write_fixture(filename: str, words: list):
+    """
+    Write a word list file with one word per line.
+
+    :param filename: the file to write
+    :param words: the words to write
+    :return: (no return value, just writes to the file)
+    """
+    with open(filename, "w", encoding="utf-8") as f:
+        for w in words:
+            f.write(f"{w}\n")
+
+
+def measure(func, repeat: int) -> float:
+    """
+    Time a function call, with its printed output discarded.
+
+    :param func: a function without arguments
+    :param repeat: how often to call the function
+    :return: the fastest time of all calls in seconds
+    """
+    best: float = float("inf")
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(sizes: list, repeat: int, source: str = None) -> dict:
+    """
+    Run all benchmarks in a temporary directory.
+
+    :param sizes: the numbers of entries of the generated word lists
+    :param repeat: how often each benchmark is run (the fastest counts)
+    :param source: (optional) a stored source word list to benchmark
+    generate_word_list() with in addition to the generated ones
+    :return: a dict of benchmark names and times in seconds
+    """
+    results: dict = {}
+    cwd = os.getcwd()
+    if source:
+        source = os.path.abspath(source)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            if source:
+                # keep the compression extension after .txt, if any:
+                (base, ext) = os.path.splitext(source)
+                if ext not in cli_wordle.SOURCE_CODECS:
+                    (base, ext) = (source, "")
+                if not base.endswith(".txt"):
+                    sys.exit(f"{source} is not a .txt file "
+                             f"(or a compressed .txt file)")
+                os.symlink(source, f"words_fixture.txt{ext}")
+                name = f"generate_word_list[{os.path.basename(source)}]"
+                results[name] = measure(
+                    lambda: cli_wordle.generate_word_list("fixture",
+                                                          WORD_LEN),
+                    repeat)
+                print(f"{name}: {results[name]:.6f} s")
+
+            for size in sizes:
+                source_lang = f"source{size}"
+                write_fixture(f"words_{source_lang}.txt",
+                              synthetic_source(size))
+                lang = f"bench{size}"
+                words = synthetic_game_words(size)
+                write_fixture(f"words_{lang}_{WORD_LEN}.txt", words)
+
+                letters = cli_wordle.list_letters(words)
+                # the word graph as the game gets it from the word table:
+                (_, _, dawg) = cli_wordle.decode_word_table(memoryview(
+                    cli_wordle.encode_word_table(
+                        words, (0, 0), cli_wordle.build_dawg(words))))
+                rare = set(RARE_LETTERS)
+                solution = words[len(words) // 2]
+                guesses = words[:6]
+                # half of the checked guesses are valid words, the others
+                # (almost always) not, because their last letter is rare:
+                checks = words[:5000] + [
+                    w[:-1] + ("Q" if w[-1] != "Q" else "Z")
+                    for w in words[:5000]]
+
+                cases = {
+                    "generate_word_list": lambda: (
+                        cli_wordle.generate_word_list(source_lang,
+                                                      WORD_LEN)),
+                    "load_words": lambda: (
+                        cli_wordle.load_words(lang, WORD_LEN)),
+                    "list_letters": lambda: (
+                        cli_wordle.list_letters(words)),
+                    "filter_words_by_letters": lambda: (
+                        cli_wordle.filter_words_by_letters(words, rare)),
+                    "color_code_hints": lambda: [
+                        cli_wordle.color_code_hints(w, solution)
+                        for w in words[:10000]],
+                    "display_alphabet": lambda: [
+                        cli_wordle.display_alphabet(lang, letters,
+                                                    guesses, solution)
+                        for _ in range(100)],
+                    "validate_guesses": lambda: [
+                        cli_wordle.dawg_contains(dawg, w) for w in checks],
+                }
+                for case, func in cases.items():
+                    name = f"{case}[{size}]"
+                    results[name] = measure(func, repeat)
+                    print(f"{name}: {results[name]:.6f} s")
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> bool:
+    """
+    Print a comparison of two benchmark runs.
+
+    :param baseline: the benchmark times to compare with
+    :param current: the new benchmark times
+    :param threshold: how much slower (as a fraction of the baseline time)
+    a benchmark may get before it counts as a regression
+    :return: True if no benchmark regressed beyond the threshold
+    and all benchmarks of the baseline are in the current results
+    """
+    ok: bool = True
+    for name, base_time in baseline.items():
+        if name not in current:
+            print(f"{name}: MISSING in current results")
+            ok = False
+            continue
+        ratio: float = current[name] / base_time if base_time else 1.0
+        status: str = ""
+        if ratio > 1 + threshold:
+            status = " REGRESSION"
+            ok = False
+        print(f"{name}: {base_time:.6f} s -> {current[name]:.6f} s",
+              f"({ratio:.2f}x){status}")
+    return ok
+
+
+if __name__ == '__main__':
+    p = ArgumentParser(description="Benchmarks for cli-wordle.")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    r = sub.add_parser("run", help="run the benchmarks")
+    r.add_argument("-o", "--output", dest="output", type=str,
+                   default="bench_results.json",
+                   help="JSON file to save the results in")
+    r.add_argument("--sizes", dest="sizes", type=int, nargs="+",
+                   default=SIZES,
+                   help="numbers of entries of the generated word lists")
+    r.add_argument("--repeat", dest="repeat", type=int, default=3,
+                   help="how often to run each benchmark")
+    r.add_argument("--source", dest="source", type=str, default=None,
+                   help="also benchmark generate_word_list() with this "
+                        "stored source word list")
+
+    c = sub.add_parser("compare",
+                       help="compare results with a baseline and fail "
+                            "on regressions")
+    c.add_argument("baseline", type=str, help="JSON file of the baseline")
+    c.add_argument("current", type=str, help="JSON file of the new results")
+    c.add_argument("-t", "--threshold", dest="threshold", type=float,
+                   default=0.25,
+                   help="allowed slowdown as a fraction (default: 0.25)")
+    args = p.parse_args()
+
+    if args.command == "run":
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "results": run_benchmarks(args.sizes, args.repeat, args.source),
+        }
+        with open(args.output, "w") as out:
+            json.dump(report, out, indent=2)
+        print(f"Saved results in '{args.output}'.")
+    else:
+        with open(args.baseline) as f:
+            base_report = json.load(f)
+        with open(args.current) as f:
+            current_report = json.load(f)
+        if not compare_results(base_report["results"],
+                               current_report["results"], args.threshold):
+            sys.exit(1)
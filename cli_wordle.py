@@ -27,6 +27,7 @@ BG_GREEN = '\033[42m'
 BG_YELLOW = '\033[43m'
 BG_BLACK = '\033[40m'
 BG_GRAY = '\033[100m'
+BG_RED = '\033[41m'
 
 GRAY = '\033[90m'
 GREEN = '\033[32m'
@@ -35,23 +36,75 @@ YELLOW = '\033[33m'
 END = '\033[0m'
 BOLD = '\033[1m'
 
+# first bytes of a binary word graph file:
+
+DAWG_MAGIC = b"cli-wordle dawg 1\n"
+
+# compression modules for stored source word lists, by file extension
+# (downloaded lists are saved with SOURCE_CODEC, which had the best
+# ratio of disk size to word list build time):
+
+SOURCE_CODECS = {
+    ".xz": "lzma",
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".zst": "zstandard",
+}
+SOURCE_CODEC = ".xz"
+
+# words with letters at or below 1/RARE_LETTER_CUTOFF as frequent
+# as the next more frequent letter are not used in the game:
+
+RARE_LETTER_CUTOFF = 6
+
+# header of a shared word table: magic bytes, modification time (ns)
+# and size of the word list file, number of words, word length,
+# number of letters and the lengths of the four DAWG arrays:
+
+SHARED_TABLE_HEADER = "<8sqqIIIIIII"
+SHARED_TABLE_MAGIC = b"wordtab2"
+
 
 def load_word_list_from_url(language: str, url: str) -> bool:
     """
     Download a word list from the internet.
     
+    The word list is stored compressed with SOURCE_CODEC. It is written
+    to a temporary file first and only replaces the stored list when
+    the download is complete, so a failed download leaves nothing behind.
+    Other stored source lists of the language are renamed to *.old,
+    so that the new list is the one that is used.
+
     :param language: The language to use for the filename
     :param url: url of a word list (must be a utf8-encoded .txt file)
     :return: True if the download was successful
     """
     
-    lang_filename: str = f"words_{language.lower()}.txt"
+    import os
+    lang_filename: str = f"words_{language.lower()}.txt{SOURCE_CODEC}"
+    # keeps the extension of the codec, but is not found as a source list:
+    tmp_filename: str = (f"words_{language.lower()}.{os.getpid()}.part"
+                         f".txt{SOURCE_CODEC}")
     import requests
-    import os.path
     print(f"Downloading {url} ...")
-    r = requests.get(url)
-    with open(lang_filename, "xb") as f:
-        f.write(r.content)
+    try:
+        r = requests.get(url, stream=True)
+        r.raise_for_status()
+        with open_source_file(tmp_filename, "wb") as f:
+            for chunk in r.iter_content(chunk_size=65536):
+                f.write(chunk)
+        os.replace(tmp_filename, lang_filename)
+        for ext in ["", *SOURCE_CODECS]:
+            old_filename: str = f"words_{language.lower()}.txt{ext}"
+            if old_filename != lang_filename and os.path.isfile(old_filename):
+                os.replace(old_filename, f"{old_filename}.old")
+                print(f"Renamed the previous word list to",
+                      f"'{old_filename}.old'.")
+    except requests.RequestException as e:
+        print(f"Download failed: {e}")
+    finally:
+        if os.path.isfile(tmp_filename):
+            os.remove(tmp_filename)
     if not os.path.isfile(lang_filename):
         print(f"could not create '{lang_filename}'.",
               f"Please download it manually from {url}.")
@@ -59,6 +112,70 @@ def load_word_list_from_url(language: str, url: str) -> bool:
     return True
 
 
+def find_source_file(language: str) -> str:
+    """
+    Find the stored source word list of a language.
+
+    A plain text file is preferred, otherwise a file compressed
+    with any of the SOURCE_CODECS is used.
+
+    :param language: the name of the language
+    :return: the name of the file, or "" if there is none
+    """
+    import os.path
+    lang_filename: str = f"words_{language.lower()}.txt"
+    for ext in ["", *SOURCE_CODECS]:
+        if os.path.isfile(lang_filename + ext):
+            return lang_filename + ext
+    return ""
+
+
+def open_source_file(filename: str, mode: str = "rt"):
+    """
+    Open a source word list file, compressed or not.
+
+    The compression is chosen by the file extension (see SOURCE_CODECS),
+    so reading a compressed file decompresses it while streaming.
+
+    :param filename: the name of the file
+    :param mode: the file mode, as for open()
+    :return: a file object
+    """
+    import os.path
+    from importlib import import_module
+
+    ext: str = os.path.splitext(filename)[1]
+    opener = open
+    if ext in SOURCE_CODECS:
+        # zstandard is not in the standard library,
+        # raises ImportError if it is not installed
+        opener = import_module(SOURCE_CODECS[ext]).open
+    if "b" in mode:
+        return opener(filename, mode)
+    return opener(filename, mode, encoding="utf-8")
+
+
+def get_source_file(language: str) -> str:
+    """
+    Find the source word list of a language, or download it.
+
+    :param language: the name of the language
+    :return: the name of the stored file, or "" if there is none
+    """
+
+    # download the source word list if it's not already stored:
+
+    if not find_source_file(language):
+        print(f"Word list source file not found in local memory.")
+        url: str = read_source_from_config(language)
+        if not url:
+            print(f"Found no source URL for {language} word list.")
+            return ""
+        if not load_word_list_from_url(language, url):
+            return ""
+    return find_source_file(language)
+
+
 def generate_word_list(
         language: str,
         word_len: int,
@@ -78,27 +195,19 @@ def generate_word_list(
     was successfully created
     """
 
-    lang_filename: str = f"words_{language.lower()}.txt"
     short_filename: str = f"words_{language.lower()}_{word_len}.txt"
 
-    # download the source word list if it's not already stored:
-
-    import os.path
-    if not os.path.isfile(lang_filename):
-        print(f"Word list source file not found in local memory.")
-        url: str = read_source_from_config(language)
-        if not url:
-            print(f"Found no source URL for {language} word list.")
-            return False
-        if not load_word_list_from_url(language, url):
-            return False
+    lang_filename: str = get_source_file(language)
+    if not lang_filename:
+        return False
 
     # create a filtered list of n letter words:
 
     print("Reading word list ...")
     word_list: list = []
+    seen_words: set = set()
 
-    with open(lang_filename, "r") as f_in:  # read words from this file
+    with open_source_file(lang_filename) as f_in:  # read words from this file
 
         print("Filtering ...")
 
@@ -123,7 +232,8 @@ def generate_word_list(
                     letter_frequency[ltr] = 1
 
             # filter for word length, discard duplicates:
-            if len(word) == word_len and word not in word_list:
+            if len(word) == word_len and word not in seen_words:
+                seen_words.add(word)
                 word_list.append(word)
 
         # sort letter frequency list by frequency (descending):
@@ -146,7 +256,7 @@ def generate_word_list(
         return False
     elif filter_by_letters:
         # filter out words with rare letters:
-        rare_letters = find_rare_letters(letter_list, 6)
+        rare_letters = find_rare_letters(letter_list, RARE_LETTER_CUTOFF)
         word_list = filter_words_by_letters(word_list, rare_letters)
 
     # if the list is too short, it makes no sense to use it:
@@ -169,6 +279,116 @@ def generate_word_list(
     return True
 
 
+def analyze_word_list(language: str, word_len: int) -> dict:
+    """
+    Count letter frequencies in the source word list of a language.
+
+    The source list is read in blocks of lines, and each block is encoded
+    as one array of code points, so the counting is done with NumPy
+    array operations instead of Python loops. Only the n letter words
+    are kept in memory. The letter counts and the rare letter decision
+    are the same as in generate_word_list().
+
+    :param language: The language to take the words from
+    :param word_len: The length of words to count letter positions in
+    :return: a dict with the overall and per-position frequency of each
+    letter and the rare letters, or an empty dict if there are no words
+    """
+    import numpy as np
+
+    lang_filename: str = get_source_file(language)
+    if not lang_filename:
+        return {}
+
+    source_words: int = 0
+    letter_frequency: dict = {}  # code point -> frequency
+    length_words: dict = {}  # distinct n letter words, in order
+
+    with open_source_file(lang_filename) as f_in:
+        while True:
+            lines: list = f_in.readlines(1 << 20)  # about 1 MB at a time
+            if not lines:
+                break
+            words: list = [line.strip().upper().replace(" ", "_")
+                           for line in lines]
+            words = [w for w in words if w]
+            source_words += len(words)
+
+            codes = np.frombuffer("".join(words).encode("utf-32-le"),
+                                  dtype="<u4")
+            for code, freq in zip(*np.unique(codes, return_counts=True)):
+                letter_frequency[int(code)] = (
+                    letter_frequency.get(int(code), 0) + int(freq))
+            length_words.update(dict.fromkeys(
+                w for w in words if len(w) == word_len))
+
+    if not source_words:
+        return {}
+
+    # overall letter frequencies, sorted by frequency (descending):
+    codes = sorted(letter_frequency)
+    letters = np.array(codes, dtype="<u4")
+    freqs = np.array([letter_frequency[c] for c in codes])
+    order = np.argsort(-freqs, kind="stable")
+    letter_list: list = [(chr(letters[i]), int(freqs[i])) for i in order]
+    rare_letters: set = find_rare_letters(letter_list, RARE_LETTER_CUTOFF)
+
+    # matrix of letter indices, one row per distinct n letter word:
+    matrix = np.frombuffer("".join(length_words).encode("utf-32-le"),
+                           dtype="<u4").reshape(-1, word_len)
+    matrix = np.searchsorted(letters, matrix)
+
+    # letter counts per position, one row per letter:
+    cells = matrix + np.arange(word_len) * len(letters)
+    positions = np.bincount(cells.ravel(), minlength=word_len * len(letters))
+    positions = positions.reshape(word_len, len(letters)).T
+
+    rare = np.isin(letters, [ord(ltr) for ltr in rare_letters])
+    playable: int = int(np.count_nonzero(~rare[matrix].any(axis=1)))
+
+    return {
+        "language": language,
+        "length": word_len,
+        "source_words": source_words,
+        "words": len(length_words),
+        "playable_words": playable,
+        "cutoff": RARE_LETTER_CUTOFF,
+        "rare_letters": sorted(rare_letters),
+        "letters": [{"letter": chr(letters[i]),
+                     "frequency": int(freqs[i]),
+                     "positions": positions[i].tolist(),
+                     "rare": bool(rare[i])}
+                    for i in order],
+    }
+
+
+def print_analysis(report: dict):
+    """
+    Print a letter frequency report as a table.
+
+    :param report: a dict as created by analyze_word_list()
+    :return: No return value, this is used for printing only
+    """
+    print(f"\n {report['language']}, {report['length']} letters:",
+          f"{report['words']} of {report['source_words']} words,",
+          f"{report['playable_words']} without rare letters\n")
+    print("  letter  frequency  ratio  ",
+          "".join(f"{i + 1:>7}" for i in range(report["length"])))
+
+    prev_freq: int = 0
+    for entry in report["letters"]:
+        freq: int = entry["frequency"]
+        ratio: str = f"{prev_freq / freq:5.2f}" if prev_freq else ""
+        mark: str = "*" if entry["rare"] else " "
+        print(f"  {mark}{entry['letter']:<6}{freq:>10}  {ratio:>5}  ",
+              "".join(f"{n:>7}" for n in entry["positions"]))
+        prev_freq = freq
+
+    print(f"\n  * rare letters (at least {report['cutoff']} times less",
+          "frequent than the previous letter or below):",
+          f"{' '.join(report['rare_letters']) or '-'}")
+
+
 def read_source_from_config(language: str) -> str:
     """
     Read the source url for the given language from config.txt.
@@ -399,6 +619,477 @@ def list_letters(words: list) -> list:
     return letters
 
 
+def build_dawg(words: list) -> tuple:
+    """
+    Build a compact directed acyclic word graph (DAWG) from a word list.
+
+    A letter trie is built first, then all nodes with identical
+    subtrees are merged, so common endings are only stored once.
+    The nodes are numbered with the root at 0 and stored in flat arrays:
+    the edges of node i are at positions starts[i] to starts[i + 1]
+    in labels (letter code points, sorted) and targets (child nodes),
+    and finals[i] is 1 if a word ends at node i.
+
+    :param words: the words to be stored
+    :return: a tuple of the arrays (starts, labels, targets, finals)
+    """
+    from array import array
+
+    trie: dict = {}
+    for w in words:
+        node = trie
+        for ltr in w:
+            node = node.setdefault(ltr, {})
+        node[""] = {}  # end of word marker
+
+    # merge identical subtrees, children are registered before parents:
+    register: dict = {}
+    nodes: list = []
+
+    def merge(trie_node: dict) -> int:
+        edges = tuple(sorted((ord(ltr), merge(child))
+                             for ltr, child in trie_node.items() if ltr))
+        signature = ("" in trie_node, edges)
+        if signature not in register:
+            register[signature] = len(nodes)
+            nodes.append(signature)
+        return register[signature]
+
+    merge(trie)
+
+    # renumber the nodes so that the root (registered last) is node 0:
+    last: int = len(nodes) - 1
+    starts = array("I", [0])
+    labels = array("I")
+    targets = array("I")
+    finals = array("B")
+    for (final, edges) in reversed(nodes):
+        for (code, child) in edges:
+            labels.append(code)
+            targets.append(last - child)
+        starts.append(len(labels))
+        finals.append(final)
+    return starts, labels, targets, finals
+
+
+def dawg_walk(dawg: tuple, text: str) -> int:
+    """
+    Follow the letters of a text through a DAWG.
+
+    :param dawg: a tuple of arrays as created by build_dawg()
+    :param text: the letters to follow, starting at the root
+    :return: the node reached after the last letter,
+    or -1 if there is no path for the text
+    """
+    from bisect import bisect_left
+
+    starts, labels, targets, finals = dawg
+    node: int = 0
+    for ltr in text:
+        code = ord(ltr)
+        lo, hi = starts[node], starts[node + 1]
+        i = bisect_left(labels, code, lo, hi)
+        if i == hi or labels[i] != code:
+            return -1
+        node = targets[i]
+    return node
+
+
+def dawg_has_prefix(dawg: tuple, prefix: str) -> bool:
+    """
+    Check if any word in a DAWG begins with the given letters.
+
+    :param dawg: a tuple of arrays as created by build_dawg()
+    :param prefix: the beginning of a word
+    :return: True if at least one word starts with prefix
+    """
+    return dawg_walk(dawg, prefix) >= 0
+
+
+def dawg_contains(dawg: tuple, word: str) -> bool:
+    """
+    Check if a word is stored in a DAWG.
+
+    :param dawg: a tuple of arrays as created by build_dawg()
+    :param word: the word to look up
+    :return: True if the word is in the DAWG
+    """
+    node = dawg_walk(dawg, word)
+    return node >= 0 and dawg[3][node] == 1
+
+
+def save_dawg(dawg: tuple, filename: str):
+    """
+    Write a DAWG to a binary file.
+
+    The file starts with a magic line and the lengths of the four
+    arrays, followed by the raw array contents. The data is written to
+    a temporary file first, which then replaces the file, so other games
+    never read a half-written file.
+
+    :param dawg: a tuple of arrays as created by build_dawg()
+    :param filename: the file to write
+    :return: (no return value, just writes to the file)
+    """
+    from array import array
+    import os
+
+    tmp_filename: str = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_filename, "wb") as f:
+            f.write(DAWG_MAGIC)
+            array("I", [len(a) for a in dawg]).tofile(f)
+            for a in dawg:
+                a.tofile(f)
+        os.replace(tmp_filename, filename)
+    finally:
+        if os.path.isfile(tmp_filename):
+            os.remove(tmp_filename)
+
+
+def read_dawg(filename: str) -> tuple:
+    """
+    Read a DAWG from a binary file written by save_dawg().
+
+    :param filename: the file to read
+    :return: a tuple of arrays (starts, labels, targets, finals),
+    or an empty tuple if the file is not a valid DAWG file
+    """
+    from array import array
+
+    with open(filename, "rb") as f:
+        if f.read(len(DAWG_MAGIC)) != DAWG_MAGIC:
+            return ()
+        try:
+            sizes = array("I")
+            sizes.fromfile(f, 4)
+            dawg: list = [array("I"), array("I"), array("I"), array("B")]
+            for a, size in zip(dawg, sizes):
+                a.fromfile(f, size)
+        except EOFError:
+            return ()
+    return tuple(dawg)
+
+
+def load_word_dawg(lang: str, length: int, words: list = None) -> tuple:
+    """
+    Load the DAWG of n-letter words of a language.
+
+    The DAWG is read from a binary file next to the word list file.
+    If there is no such file or the word list is newer, the DAWG is
+    built from the word list and saved for the next time.
+
+    :param lang: the language to load words from
+    :param length: number of letters (n) in each word
+    :param words: (optional) the already loaded word list,
+    otherwise it is loaded when the DAWG has to be built
+    :return: a tuple of arrays as created by build_dawg()
+    """
+    import os.path
+    filename = f"words_{lang.lower()}_{length}.dawg"
+    words_filename = f"words_{lang.lower()}_{length}.txt"
+
+    if (os.path.isfile(filename) and os.path.isfile(words_filename)
+            and os.path.getmtime(filename)
+            >= os.path.getmtime(words_filename)):
+        dawg = read_dawg(filename)
+        if dawg:
+            return dawg
+
+    if words is None:
+        words = load_words(lang, length)
+    dawg = build_dawg(words)
+    save_dawg(dawg, filename)
+    return dawg
+
+
+def encode_word_table(words: list, identity: tuple, dawg: tuple) -> bytes:
+    """
+    Encode a word list, its letters and its DAWG as one block of bytes.
+
+    :param words: the words, all of the same length
+    :param identity: (modification time in ns, size) of the word list file
+    :param dawg: a tuple of arrays as created by build_dawg()
+    :return: the header (see SHARED_TABLE_HEADER) followed by the letters
+    and words as UTF-32 code units and the raw arrays of the DAWG
+    """
+    from struct import pack
+
+    letters: list = list_letters(words)
+    header: bytes = pack(SHARED_TABLE_HEADER, SHARED_TABLE_MAGIC,
+                         *identity, len(words), len(words[0]), len(letters),
+                         *[len(a) for a in dawg])
+    return b"".join([header,
+                     ("".join(letters) + "".join(words)).encode("utf-32-le"),
+                     *[a.tobytes() for a in dawg]])
+
+
+def decode_word_table(buf: memoryview) -> tuple:
+    """
+    Read the parts of an encoded word table without copying the words.
+
+    :param buf: a word table as created by encode_word_table()
+    :return: a tuple of the view of the words, a sorted list of all
+    letters in the words and the DAWG as a tuple of array views
+    """
+    from struct import calcsize, unpack_from
+
+    (_, _, _, word_count, word_len, letter_count, *sizes) = unpack_from(
+        SHARED_TABLE_HEADER, buf)
+    pos: int = calcsize(SHARED_TABLE_HEADER)
+    letters: list = list(bytes(buf[pos:pos + 4 * letter_count]
+                               ).decode("utf-32-le"))
+    pos += 4 * letter_count
+    table = buf[pos:pos + 4 * word_count * word_len]
+    pos += 4 * word_count * word_len
+
+    dawg: list = []
+    for size, fmt in zip(sizes, "IIIB"):
+        end: int = pos + size * (1 if fmt == "B" else 4)
+        dawg.append(buf[pos:end].cast(fmt))
+        pos = end
+    return table, letters, tuple(dawg)
+
+
+def build_word_table(lang: str, length: int, identity: tuple) -> bytes:
+    """
+    Load the n-letter words of a language and encode them as a table.
+
+    :param lang: the language to load words from
+    :param length: number of letters (n) in each word
+    :param identity: (modification time in ns, size) of the word list file
+    :return: the encoded table, or b"" if there are no words
+    """
+    words: list = load_words(lang, length)
+    if not words:
+        return b""
+    return encode_word_table(words, identity,
+                             load_word_dawg(lang, length, words))
+
+
+def attach_word_table(lang: str, length: int) -> tuple:
+    """
+    Get the table of n-letter words of a language from shared memory.
+
+    The first game that needs a word table writes it to a file in a
+    private directory of the user (see shared_table_dir()), later games
+    map that file into memory instead of loading the word list. The file
+    name contains a hash of the word list's path, and the table is
+    rebuilt when the word list file has changed.
+
+    Each game holds a shared lock on the file while it runs. At exit,
+    the last game removes the file; if a game was killed, the file is
+    reused and removed by a later game.
+
+    Where mapping files or file locking is not available, the table
+    is a private copy in the same format.
+
+    :param lang: the language to load words from
+    :param length: number of letters (n) in each word
+    :return: a tuple of the word table, a sorted list of all letters
+    in the words and the DAWG of the words
+    """
+    import os
+
+    words_filename: str = f"words_{lang.lower()}_{length}.txt"
+    if (not os.path.isfile(words_filename)
+            and not generate_word_list(lang, length)):
+        print("Could not generate word list file.")
+        return memoryview(b""), [], ()
+
+    try:
+        import fcntl
+        import mmap
+        # raises ImportError if unsupported
+    except ImportError:
+        fcntl = None
+
+    if fcntl:
+        try:
+            return map_word_table(lang, length, words_filename)
+        except OSError as e:
+            print(f"Could not share the word table ({e}), loading it.")
+
+    data: bytes = build_word_table(lang, length, (0, 0))
+    if not data:
+        return memoryview(b""), [], ()
+    return decode_word_table(memoryview(data))
+
+
+def shared_table_dir() -> str:
+    """
+    Find or create the private directory for shared word tables.
+
+    The directory is in $XDG_RUNTIME_DIR if that is set, otherwise in
+    /dev/shm (or the temp directory). It must belong to the user and
+    must not be accessible by anyone else, so other users can't
+    block or replace the word tables.
+
+    :return: the path of the directory
+    """
+    import os
+    import stat
+    import tempfile
+
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        table_dir: str = os.path.join(os.environ["XDG_RUNTIME_DIR"],
+                                      "cli_wordle")
+    else:
+        base_dir: str = "/dev/shm"
+        if not os.path.isdir(base_dir):
+            base_dir = tempfile.gettempdir()
+        table_dir = os.path.join(base_dir, f"cli_wordle-{os.getuid()}")
+
+    try:
+        os.mkdir(table_dir, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(table_dir)
+    if (not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid()
+            or info.st_mode & 0o077):
+        raise PermissionError(f"'{table_dir}' is not a private directory")
+    return table_dir
+
+
+def lock_file(filename: str):
+    """
+    Open a lock file and wait for an exclusive lock on it.
+
+    The lock file is removed by the last game using a table, so after
+    getting the lock, this checks that the file still exists under
+    its name, and tries again otherwise.
+
+    :param filename: the name of the lock file
+    :return: the open lock file, which is unlocked by closing it
+    """
+    import fcntl
+    import os
+
+    while True:
+        lock = open(filename, "a")
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if os.stat(filename).st_ino == os.fstat(lock.fileno()).st_ino:
+                return lock
+        except FileNotFoundError:
+            pass
+        lock.close()
+
+
+def map_word_table(lang: str, length: int, words_filename: str) -> tuple:
+    """
+    Map the shared table file of a word list, creating it if needed.
+
+    :param lang: the language to load words from
+    :param length: number of letters (n) in each word
+    :param words_filename: the word list file
+    :return: a tuple as returned by attach_word_table()
+    """
+    import atexit
+    import fcntl
+    import mmap
+    import os
+    from struct import calcsize, unpack_from
+    from zlib import crc32
+
+    stat = os.stat(words_filename)
+    identity: tuple = (stat.st_mtime_ns, stat.st_size)
+
+    name: str = "".join(
+        c if c.isascii() and c.isalnum() else "_" for c in lang.lower()
+    ) + f"_{length}_{crc32(os.path.abspath(words_filename).encode()):08x}"
+    table_dir: str = shared_table_dir()
+    table_filename: str = os.path.join(table_dir, name)
+    lock_filename: str = os.path.join(table_dir, f"{name}.lock")
+
+    with lock_file(lock_filename):
+        table_file = None
+        if os.path.isfile(table_filename):
+            table_file = open(table_filename, "rb")
+            info = os.fstat(table_file.fileno())
+            if info.st_uid != os.getuid():
+                table_file.close()
+                raise PermissionError(
+                    f"'{table_filename}' belongs to another user")
+            if info.st_size < calcsize(SHARED_TABLE_HEADER):
+                table_file.close()
+                table_file = None
+            else:
+                with mmap.mmap(table_file.fileno(), calcsize(
+                        SHARED_TABLE_HEADER), access=mmap.ACCESS_READ) as m:
+                    header: tuple = unpack_from(SHARED_TABLE_HEADER, m)
+                if header[:3] != (SHARED_TABLE_MAGIC, *identity):
+                    # written by an older version, or the word list changed:
+                    table_file.close()
+                    table_file = None
+
+        if table_file is None:
+            data: bytes = build_word_table(lang, length, identity)
+            if not data:
+                return memoryview(b""), [], ()
+            # games still using an old table keep their copy of it:
+            tmp_filename: str = f"{table_filename}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_filename, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_filename, table_filename)
+            finally:
+                if os.path.isfile(tmp_filename):
+                    os.remove(tmp_filename)
+            table_file = open(table_filename, "rb")
+
+        # the shared lock shows other games that this one uses the table,
+        # the system releases it however this game ends:
+        fcntl.flock(table_file, fcntl.LOCK_SH)
+        buf = memoryview(mmap.mmap(table_file.fileno(), 0,
+                                   access=mmap.ACCESS_READ))
+
+    atexit.register(release_word_table, table_file, table_filename,
+                    lock_filename)
+    return decode_word_table(buf)
+
+
+def release_word_table(table_file, table_filename: str, lock_filename: str):
+    """
+    Stop using a shared word table, and remove it if no other game uses it.
+
+    :param table_file: the open table file this game holds a lock on
+    :param table_filename: the name of the table file
+    :param lock_filename: the file that guards creating and removing tables
+    :return: (no return value)
+    """
+    import fcntl
+    import os
+
+    try:
+        with lock_file(lock_filename):
+            try:
+                fcntl.flock(table_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return  # other games still use the table
+            # only remove the file if it was not replaced by a newer table:
+            if (os.path.isfile(table_filename)
+                    and os.stat(table_filename).st_ino
+                    == os.fstat(table_file.fileno()).st_ino):
+                os.remove(table_filename)
+                os.remove(lock_filename)
+    except OSError:
+        pass
+
+
+def table_word(table, length: int, index: int) -> str:
+    """
+    Read a word from a word table.
+
+    :param table: a word table as returned by attach_word_table()
+    :param length: number of letters in each word
+    :param index: the position of the word in the table
+    :return: the word at that position
+    """
+    size: int = 4 * length
+    return bytes(table[index * size:(index + 1) * size]).decode("utf-32-le")
+
+
 def bold_colored_letter(letter: str, color: str) -> str:
     """
     Apply bold, spacing and color to the given letter.
@@ -437,8 +1128,8 @@ def color_code_hints(text: str, pattern: str) -> str:
     return ctext
 
 
-def color_code_input(letter: str, place: int, pattern: str, prev_lines: list
-                     ) -> str:
+def color_code_input(letter: str, place: int, pattern: str, prev_lines: list,
+                     valid_prefix: bool = True) -> str:
     """
     Apply input line hint color to a letter.
     
@@ -446,6 +1137,8 @@ def color_code_input(letter: str, place: int, pattern: str, prev_lines: list
     :param place: position of the letter in the input line
     :param pattern: the solution to derive hints from
     :param prev_lines: words that were guessed before
+    :param valid_prefix: if False, the letter is marked with a red
+    background because no word starts with the input up to this letter
     :return: a string of one bold letter with hint color and spacing
     """
     hint_color: str = ""
@@ -464,6 +1157,8 @@ def color_code_input(letter: str, place: int, pattern: str, prev_lines: list
             hint_color = YELLOW
             # next line might still have a green hint
             continue
+    if not valid_prefix:
+        hint_color = BG_RED + hint_color
     text = bold_colored_letter(letter, hint_color)
     return text
 
@@ -496,7 +1191,8 @@ def display_guesses(
 
 
 def display_input_char(
-        ch: str, place: int, guessed_words: list, pattern: str):
+        ch: str, place: int, guessed_words: list, pattern: str,
+        valid_prefix: bool = True):
     """
     Print the given char with nice formatting, or delete the last one.
     
@@ -505,6 +1201,7 @@ def display_input_char(
     :param place: position of the character in the input line
     :param guessed_words: previous guesses to derive hints from
     :param pattern: solution to derive hints from
+    :param valid_prefix: False if no word starts with the input so far
     :return: No return value, this is used for printing only
     """
     # delete / backspace:
@@ -512,8 +1209,8 @@ def display_input_char(
         print("\b\b\b\x1B[0K", end="", flush=True)
     # letters:
     else:
-        input_letter: str = color_code_input(ch.upper(),
-                                             place, pattern, guessed_words)
+        input_letter: str = color_code_input(ch.upper(), place, pattern,
+                                             guessed_words, valid_prefix)
         print(input_letter, end="", flush=True)
 
 
@@ -594,9 +1291,19 @@ def start_game(language: str = None, word_len: int = None):
         if not language:
             language = conf_lang
 
-    all_words = load_words(language, word_len)
+    (word_table, allowed_letters, word_graph) = attach_word_table(
+        language, word_len)
+    # closing the terminal or kill should also run the exit handlers,
+    # which release the shared word table:
+    import signal
+    import sys
+    for signame in ("SIGTERM", "SIGHUP"):
+        signum = getattr(signal, signame, None)
+        if signum and signal.getsignal(signum) == signal.SIG_DFL:
+            signal.signal(signum, lambda sig, frame: sys.exit(128 + sig))
+    word_count: int = len(word_table) // (4 * word_len)
 
-    if len(all_words) > 0:
+    if word_count > 0:
 
         max_guesses: int = max(6, word_len + max(1, (word_len // 3)))
         guesses: int = 0
@@ -607,10 +1314,8 @@ def start_game(language: str = None, word_len: int = None):
         lines: int = max_guesses + message_lines
 
         # choose a random word from the word list as the solution:
-        pick_number: int = randint(1, len(all_words))
-        solution: str = all_words[pick_number - 1]
-
-        allowed_letters: list = list_letters(all_words)
+        pick_number: int = randint(1, word_count)
+        solution: str = table_word(word_table, word_len, pick_number - 1)
 
         print("\n Welcome to COMMAND LINE WORDLE!\n")
         print(f" Guess the {language} word\n with {word_len}",
@@ -640,8 +1345,9 @@ def start_game(language: str = None, word_len: int = None):
                 if len(current_input) == 0:
                     if c.isalpha() and c.upper() in allowed_letters:
                         current_input += c
-                        display_input_char(c, len(current_input),
-                                           guessed, solution)
+                        display_input_char(
+                            c, len(current_input), guessed, solution,
+                            dawg_has_prefix(word_graph, current_input.upper()))
                     elif (c.isalpha()
                           or c.upper() in allowed_letters
                           or c == '\x20'):
@@ -666,8 +1372,9 @@ def start_game(language: str = None, word_len: int = None):
                         continue
                     else:
                         break
-                    display_input_char(c, len(current_input),
-                                       guessed, solution)
+                    display_input_char(
+                        c, len(current_input), guessed, solution,
+                        dawg_has_prefix(word_graph, current_input.upper()))
 
                 # in a full line, only backspace or enter is allowed:
                 elif len(current_input) == word_len:
@@ -690,7 +1397,7 @@ def start_game(language: str = None, word_len: int = None):
 
             current_line: int = guesses
 
-            if guess in all_words:
+            if dawg_contains(word_graph, guess):
                 message = default_message
                 guesses += 1
                 guessed.append(guess)
@@ -716,7 +1423,7 @@ def start_game(language: str = None, word_len: int = None):
             print(f"\x1B[{str(lines - guesses)}F\x1B[2K", end="")
 
         # in case you want to look up the word in your text file later:
-        print(f" (Random word number {pick_number} of {len(all_words)})\n")
+        print(f" (Random word number {pick_number} of {word_count})\n")
 
 
 if __name__ == '__main__':
@@ -737,6 +1444,11 @@ if __name__ == '__main__':
                    help="set the URL to download a word list from")
     p.add_argument("-s", "--save", action="store_true", dest="save",
                    help="remember settings for future uses")
+    p.add_argument("--analyze", action="store_true", dest="analyze",
+                   help="show letter frequencies of the word list "
+                        "(of all languages if no language is set) and exit")
+    p.add_argument("--json", action="store_true", dest="json",
+                   help="show the --analyze report as JSON")
     args = p.parse_args()
     
     if args.url:
@@ -752,6 +1464,32 @@ if __name__ == '__main__':
         languages = list_all_languages()
         for lan in languages:
             print(lan)
+    elif args.analyze:
+        analyze_length = args.length or read_config()[0]
+        if args.language:
+            languages = [args.language]
+        else:
+            languages = list_all_languages()
+        import sys
+        from contextlib import redirect_stdout
+        from lzma import LZMAError
+        reports = []
+        for lan in languages:
+            # keep status messages out of the JSON output:
+            with redirect_stdout(sys.stderr if args.json else sys.stdout):
+                try:
+                    report = analyze_word_list(lan, analyze_length)
+                except (OSError, ImportError, EOFError, LZMAError) as e:
+                    print(f"Could not analyze the {lan} word list: {e}")
+                    continue
+            if report:
+                reports.append(report)
+        if args.json:
+            import json
+            print(json.dumps(reports, ensure_ascii=False, indent=2))
+        else:
+            for rep in reports:
+                print_analysis(rep)
     elif args.rules:
         print("\nGuess the secret word by typing in any word",
               "\nand using the hints for your next guess:\n\n",